@@ -0,0 +1,115 @@
+"""
+    Background queue for batching outgoing notification emails
+    Copyright (C) 2021  Emerson Dove
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Lesser General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import atexit
+import queue
+import threading
+import time
+import typing
+
+from blankly.utils.utils import info_print
+
+# Longest that interpreter exit will wait on messages which are still queued
+EXIT_FLUSH_TIMEOUT = 30
+
+
+class MailQueue:
+    def __init__(self, send_batch: typing.Callable):
+        """
+        Queue messages & send them from a single worker thread. Every message that has accumulated while the previous
+         batch was sending is passed to send_batch together so that they can share a single SMTP session.
+
+        Args:
+            send_batch: Function that takes a list of queued messages and sends them
+        """
+        self.__send_batch = send_batch
+        self.__queue = queue.Queue()
+        self.__thread = None
+        self.__lock = threading.Lock()
+        # Exceptions raised while sending, these are re-raised to the caller on the next flush
+        self.__errors = []
+
+    def put(self, message) -> None:
+        """
+        Add a message to the queue, this returns immediately
+        """
+        with self.__lock:
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__worker, daemon=True)
+                self.__thread.start()
+                # The worker is a daemon, so try to deliver anything left before the interpreter exits
+                atexit.register(self.__flush_at_exit)
+
+        self.__queue.put(message)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Block until every queued message has been processed. If any batch failed to send since the last flush, the
+         first exception is raised here
+
+        Args:
+            timeout: Optional number of seconds to wait before giving up
+
+        Returns:
+            bool: True if every queued message was sent, False if the timeout was reached first
+        """
+        end = None if timeout is None else time.time() + timeout
+        with self.__queue.all_tasks_done:
+            while self.__queue.unfinished_tasks:
+                if end is None:
+                    self.__queue.all_tasks_done.wait()
+                else:
+                    remaining = end - time.time()
+                    if remaining <= 0:
+                        return False
+                    self.__queue.all_tasks_done.wait(remaining)
+
+        with self.__lock:
+            errors = self.__errors
+            self.__errors = []
+        if len(errors) > 0:
+            raise errors[0]
+        return True
+
+    def __flush_at_exit(self):
+        # Exceptions raised from atexit are only printed, so report the problem directly instead of raising
+        try:
+            if not self.flush(EXIT_FLUSH_TIMEOUT):
+                info_print(f"Exiting with {self.__queue.unfinished_tasks} queued message(s) that were not sent "
+                           f"within {EXIT_FLUSH_TIMEOUT} seconds.")
+        except Exception as e:
+            info_print(f"Failed to send queued message(s) before exiting: {e}")
+
+    def __worker(self):
+        while True:
+            batch = [self.__queue.get()]
+            while True:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.__send_batch(batch)
+            except Exception as e:
+                # There is no caller to raise to here, so hold onto it for flush & keep the worker alive
+                with self.__lock:
+                    self.__errors.append(e)
+            finally:
+                for _ in batch:
+                    self.__queue.task_done()
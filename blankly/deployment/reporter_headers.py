@@ -21,6 +21,7 @@ import ssl
 
 from typing import Any
 
+from blankly.deployment._mail_queue import MailQueue
 from blankly.utils.utils import load_notify_preferences
 from blankly.frameworks.strategy import Strategy
 from blankly.frameworks.screener.screener import Screener
@@ -31,7 +32,7 @@ class Reporter:
     def __init__(self):
         self.__live_vars = {}
         self.__screener = None
-        pass
+        self.__mail_queue = MailQueue(self.__send_batch)
 
     def export_live_var(self, var: Any, name: str, description: str = None):
         """
@@ -137,6 +138,23 @@ class Reporter:
         Args:
             text: The message body to be sent to your phone number
         """
+        self.__send_email(text, override_receiver=self.__text_receiver())
+
+    def enqueue_text(self, text: str):
+        """
+        Queue a text message to be sent in the background alongside any queued emails. This returns without waiting
+         for the send.
+
+        Args:
+            text: The message body to be sent to your phone number
+        """
+        self.__mail_queue.put((text, self.__text_receiver()))
+
+    @staticmethod
+    def __text_receiver() -> str:
+        """
+        Find the email address that forwards to the phone number in notify.json
+        """
         notify_preferences = load_notify_preferences()
         provider = notify_preferences['text']['provider']
         phone_number = notify_preferences['text']['phone_number']
@@ -156,12 +174,12 @@ class Reporter:
         except KeyError:
             raise KeyError("Provider not found. Check the notify.json documentation to see supported providers.")
 
-        self.__send_email(text, override_receiver=phone_number + email)
+        return phone_number + email
 
     @staticmethod
-    def __send_email(email_str: str, override_receiver=None):
+    def __send_batch(messages: list):
         """
-        Internal email send. This is separated because override_receiver shouldn't be exposed to the user
+        Send a list of (email_str, override_receiver) messages over a single SMTP session
         """
         notify_preferences = load_notify_preferences()
         port = notify_preferences['email']['port']
@@ -170,15 +188,18 @@ class Reporter:
         receiver_email = notify_preferences['email']['receiver_email']
         password = notify_preferences['email']['password']
 
-        if override_receiver is not None:
-            receiver_email = override_receiver
-
-        message = email_str
-
         context = ssl.create_default_context()
         with smtplib.SMTP_SSL(smtp_server, port, context=context) as server:
             server.login(sender_email, password)
-            server.sendmail(sender_email, receiver_email, message)
+            for message, override_receiver in messages:
+                server.sendmail(sender_email, receiver_email if override_receiver is None else override_receiver,
+                                message)
+
+    def __send_email(self, email_str: str, override_receiver=None):
+        """
+        Internal email send. This is separated because override_receiver shouldn't be exposed to the user
+        """
+        self.__send_batch([(email_str, override_receiver)])
 
     def email(self, email: str):
         """
@@ -188,3 +209,25 @@ class Reporter:
             email: The body of the email to send
         """
         self.__send_email(email)
+
+    def enqueue_email(self, email: str):
+        """
+        Queue an email to be sent in the background. Emails queued close together are sent over a single SMTP
+         session, and this returns without waiting for the send.
+
+        Args:
+            email: The body of the email to send
+        """
+        self.__mail_queue.put((email, None))
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait for every queued email & text to be sent. If any of them failed to send, the error is raised here
+
+        Args:
+            timeout: Optional number of seconds to wait before giving up
+
+        Returns:
+            bool: True if all queued messages were sent, False if the timeout was reached first
+        """
+        return self.__mail_queue.flush(timeout)
@@ -16,7 +16,6 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import abc
-import time
 
 import blankly
 from blankly.exchanges.abc_exchange import ABCExchange
@@ -34,11 +33,11 @@ class Exchange(ABCExchange, abc.ABC):
     interface: ABCExchangeInterface
 
     def __init__(self, exchange_type, portfolio_name, preferences_path):
-        self.__type = exchange_type  # coinbase_pro, binance, alpaca, oanda, ftx
-        self.__name = portfolio_name  # my_cool_portfolio
+        self._type = exchange_type  # coinbase_pro, binance, alpaca, oanda, ftx
+        self._name = portfolio_name  # my_cool_portfolio
 
         # Make a public version of portfolio name
-        self.portfolio_name = self.__name
+        self.portfolio_name = self._name
 
         self.preferences = blankly.utils.load_user_preferences(preferences_path)
 
@@ -67,28 +66,28 @@ class Exchange(ABCExchange, abc.ABC):
         The core functions that creates the interface based on the exchange type & automatically caches
         """
         self.calls = calls
-        if self.__type == "coinbase_pro":
-            self.interface = CoinbaseProInterface(self.__type, calls)
-        elif self.__type == "binance":
-            self.interface = BinanceInterface(self.__type, calls)
-        elif self.__type == "alpaca":
-            self.interface = AlpacaInterface(self.__type, calls)
-        elif self.__type == "ftx":
-            self.interface = FTXInterface(self.__type, calls)
-        elif self.__type == "oanda":
-            self.interface = OandaInterface(self.__type, calls)
-        elif self.__type == "kucoin":
-            self.interface = KucoinInterface(self.__type, calls)
-
-        blankly.reporter.export_used_exchange(self.__type)
-
-        write_auth_cache(self.__type, self.__name, calls)
+        if self._type == "coinbase_pro":
+            self.interface = CoinbaseProInterface(self._type, calls)
+        elif self._type == "binance":
+            self.interface = BinanceInterface(self._type, calls)
+        elif self._type == "alpaca":
+            self.interface = AlpacaInterface(self._type, calls)
+        elif self._type == "ftx":
+            self.interface = FTXInterface(self._type, calls)
+        elif self._type == "oanda":
+            self.interface = OandaInterface(self._type, calls)
+        elif self._type == "kucoin":
+            self.interface = KucoinInterface(self._type, calls)
+
+        blankly.reporter.export_used_exchange(self._type)
+
+        write_auth_cache(self._type, self._name, calls)
 
     def get_name(self):
-        return self.__name
+        return self._name
 
     def get_type(self):
-        return self.__type
+        return self._type
 
     def get_preferences(self):
         return self.preferences
@@ -106,27 +105,20 @@ class Exchange(ABCExchange, abc.ABC):
         This is used only for multiprocessed bots which are appended directly to the exchange. NOT bots that use
         the strategy class.
         """
+        models = self.models
         if symbol is not None:
             # Run a specific model with the args
-            if not self.models[symbol]["model"].is_running():
-                self.models[symbol]["model"].run(self.models[symbol]["args"])
+            entry = models[symbol]
+            if not entry["model"].is_running():
+                entry["model"].run(entry["args"])
         else:
-            for coin_iterator in self.models:
-                # Start all models
-                if not self.models[coin_iterator]["model"].is_running():
-                    self.models[coin_iterator]["model"].run(self.models[coin_iterator]["args"])
-                    # There is some delay. Optimally the bots should be started in a different thread so this doesn't
-                    # block the main
-                    time.sleep(.1)
+            for coin_iterator, entry in models.items():
+                # Start all models. run() only starts the model's process, so there is no need to wait between them
+                if not entry["model"].is_running():
+                    entry["model"].run(entry["args"])
                 else:
                     print("Ignoring the model on " + coin_iterator)
 
-    def __get_model(self, coin):
-        """
-        Get the model to reference to
-        """
-        return self.models[coin]["model"]
-
     def get_model_state(self, symbol):
         """
         Returns JUST the model state, as opposed to all the data returned by get_asset_state()
@@ -135,7 +127,7 @@ class Exchange(ABCExchange, abc.ABC):
         Args:
             symbol: Currency that the selected model is running on.
         """
-        return (self.__get_model(symbol)).get_state()
+        return self.models[symbol]["model"].get_state()
 
     def get_full_state(self, symbol):
         """
@@ -165,7 +157,7 @@ class Exchange(ABCExchange, abc.ABC):
             key: Key to assign a value to
             value: Value to assign to the key
         """
-        self.__get_model(symbol).update_state(key, value)
+        self.models[symbol]["model"].update_state(key, value)
 
     def append_model(self, model, symbol, args=None):
         """
@@ -175,12 +167,11 @@ class Exchange(ABCExchange, abc.ABC):
             symbol: the currency to use, such as "BTC-USD"
             args: Args to pass into the model when it is run. This can be any datatype, the object is passed
         """
-        added_model = model
         self.models[symbol] = {
-            "model": added_model,
+            "model": model,
             "args": args
         }
-        model.setup(self.__type, symbol, self.preferences, self.get_full_state(symbol),
+        model.setup(self._type, symbol, self.preferences, self.get_full_state(symbol),
                     self.interface)
 
     @abc.abstractmethod
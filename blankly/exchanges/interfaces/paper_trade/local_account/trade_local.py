@@ -56,22 +56,22 @@ class LocalAccount:
         """
 
         # Extract the base and quote pairs of the currency
-        base = utils.get_base_asset(symbol)
-        quote = utils.get_quote_asset(symbol)
+        base, quote = utils.split_symbol(symbol)
 
-        # Push these abstracted deltas to the local account
-        try:
-            self.local_account[base]['available'] = utils.trunc(self.local_account[base]['available'] + base_delta,
-                                                                base_resolution)
-        except KeyError:
+        # Bind the account once & validate membership up front so the common path avoids exception handling
+        local_account = self.local_account
+        if base not in local_account:
             raise KeyError("Base currency specified not found in local account")
-
-        try:
-            self.local_account[quote]['available'] = utils.trunc(self.local_account[quote]['available'] + quote_delta,
-                                                                 quote_resolution)
-        except KeyError:
+        if quote not in local_account:
             raise KeyError("Quote currency specified not found in local account")
 
+        # Push these abstracted deltas to the local account
+        base_account = local_account[base]
+        base_account['available'] = utils.trunc(base_account['available'] + base_delta, base_resolution)
+
+        quote_account = local_account[quote]
+        quote_account['available'] = utils.trunc(quote_account['available'] + quote_delta, quote_resolution)
+
     def test_trade(self, currency_pair, side, qty, quote_price, quote_resolution, base_resolution, shortable) -> bool:
         """
         Test a paper trade to see if you have the funds
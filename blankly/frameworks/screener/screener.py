@@ -16,7 +16,9 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import copy
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from blankly.frameworks.screener.screener_runner import ScreenerRunner
 from blankly.utils.utils import load_deployment_settings
@@ -24,7 +26,26 @@ from blankly.utils.utils import load_deployment_settings
 import blankly
 from blankly.exchanges.exchange import Exchange
 from blankly.frameworks.screener.screener_state import ScreenerState
-from copy import deepcopy
+
+
+def _clone(obj):
+    """
+    Copy the nested dictionaries & lists of the evaluator results. Anything else is treated as an immutable value
+     and shared with the original, which avoids the overhead of a full deepcopy.
+    """
+    # Shallow copy the container first so that subclasses (AttributeDict, defaultdict, Counter...) keep their type
+    #  & any extra state, then replace the values with their clones
+    if isinstance(obj, dict):
+        copied = copy.copy(obj)
+        for key, value in obj.items():
+            copied[key] = _clone(value)
+        return copied
+    elif isinstance(obj, list):
+        copied = copy.copy(obj)
+        for i, value in enumerate(obj):
+            copied[i] = _clone(value)
+        return copied
+    return obj
 
 
 class Screener:
@@ -33,7 +54,8 @@ class Screener:
                  symbols: List[str],
                  init: typing.Callable = None,
                  final: typing.Callable = None,
-                 formatter: typing.Callable = None):
+                 formatter: typing.Callable = None,
+                 max_workers: int = None):
         """
         Create a new screener.
 
@@ -57,8 +79,23 @@ class Screener:
             final: Optional teardown code to run before the program finishes. This will be run every time the
              screener finishes a cycle
             formatter: Optional formatting function that pretties the results form the evaluator
+            max_workers: Optional number of threads used to run the evaluator across symbols. This defaults to one
+             thread per symbol, up to 32. Pass 1 to evaluate the symbols serially
+
+        The evaluator is run concurrently across symbols, so it must be thread-safe. Wrap any writes to
+         screener_state.variables in the screener_state.lock if multiple symbols modify shared values.
+
+        Evaluator results should be built from dictionaries, lists & primitive values. The dictionaries & lists are
+         copied before being passed to the formatter, but any other objects (such as numpy arrays) are shared between
+         the raw & formatted results, so the formatter should replace rather than mutate them.
         """
 
+        if not callable(evaluator):
+            raise TypeError("Must pass a callable for the evaluator.")
+
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+
         if not blankly.is_deployed and blankly._screener_runner is None:
             cron_settings = load_deployment_settings()['screener']['schedule']
             blankly._screener_runner = ScreenerRunner(cron_settings)
@@ -66,14 +103,13 @@ class Screener:
         # TODO export the symbols here as a list
         self.exchange = exchange
         self.symbols = symbols
+        self.max_workers = max_workers
 
-        # Store callables as a dictionary
-        self.__callables = {
-            'evaluator': evaluator,
-            'init': init,
-            'teardown': final,
-            'formatter': formatter
-        }
+        # Resolve the callables once, optional functions that aren't callable are skipped
+        self._evaluator = evaluator
+        self._init = init if callable(init) else None
+        self._teardown = final if callable(final) else None
+        self._formatter = formatter if callable(formatter) else None
         self.interface = exchange.interface
 
         # Creat the screener state and pass in this screener object
@@ -89,9 +125,8 @@ class Screener:
         self.__run()
 
     def __run(self):
-        init = self.__callables['init']
-        if callable(init):
-            init(self.screener_state)
+        if self._init is not None:
+            self._init(self.screener_state)
 
         self.symbols = self.screener_state.symbols
 
@@ -105,35 +140,46 @@ class Screener:
         #     }
         # }
 
-        evaluator = self.__callables['evaluator']
-        if not callable(evaluator):
-            raise TypeError("Must pass a callable for the evaluator.")
+        evaluator = self._evaluator
 
-        for i in self.symbols:
+        def evaluate(symbol):
             # Parse the types for the symbol
             # If it's a dictionary it's A ok but if it's a non-dict give it the value column
-            result = evaluator(i, self.screener_state)
+            result = evaluator(symbol, self.screener_state)
             if not isinstance(result, dict):
                 result = {
                     'value': result
                 }
-            self.raw_results[i] = result
+            return result
+
+        symbols = list(self.symbols)
+        if len(symbols) > 0:
+            max_workers = self.max_workers
+            if max_workers is None:
+                max_workers = min(32, len(symbols))
+
+            # Evaluators are generally network bound so run them concurrently
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for symbol, result in zip(symbols, executor.map(evaluate, symbols)):
+                    self.raw_results[symbol] = result
 
         self.symbols = self.screener_state.symbols
 
         # Copy the evaluator results so that they can be formatted
-        self.formatted_results = deepcopy(self.raw_results)
+        self.formatted_results = _clone(self.raw_results)
 
-        formatter = self.__callables['formatter']
-        if callable(formatter):
+        if self._formatter is not None:
             # Mutate the copied dictionary
-            self.formatted_results = formatter(self.formatted_results, self.screener_state)
+            self.formatted_results = self._formatter(self.formatted_results, self.screener_state)
 
         self.symbols = self.screener_state.symbols
 
-        teardown = self.__callables['teardown']
-        if callable(teardown):
-            teardown(self.screener_state)
+        if self._teardown is not None:
+            self._teardown(self.screener_state)
+
+        # Screener scripts exit once they finish, so make sure queued notifications are delivered first
+        if not blankly.is_deployed:
+            blankly.reporter.flush()
 
         self.symbols = self.screener_state.symbols
 
@@ -153,6 +199,10 @@ class Screener:
         if message is not None:
             use_str = message
 
-        blankly.reporter.email(use_str)
-
-        blankly.reporter.text(use_str)
+        if blankly.is_deployed:
+            blankly.reporter.email(use_str)
+            blankly.reporter.text(use_str)
+        else:
+            # Queue the messages so a screener notifying many times doesn't block on each SMTP session
+            blankly.reporter.enqueue_email(use_str)
+            blankly.reporter.enqueue_text(use_str)
@@ -16,6 +16,7 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import threading
 import time
 
 from blankly.exchanges.interfaces.abc_exchange_interface import ABCExchangeInterface as Interface
@@ -26,6 +27,7 @@ class ScreenerState:
     interface: Interface
     variables: AttributeDict
     symbols: list
+    lock: threading.Lock
 
     def __init__(self, screener):
         """
@@ -38,6 +40,8 @@ class ScreenerState:
         self.screener = screener
         self.variables = AttributeDict({})
         self.symbols = screener.symbols
+        # Evaluators run concurrently, use this to guard changes to shared variables
+        self.lock = threading.Lock()
 
     @property
     def interface(self) -> Interface:
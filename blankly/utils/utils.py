@@ -22,6 +22,7 @@ import sys
 import decimal
 import os
 from datetime import datetime as dt, timezone
+from functools import lru_cache
 from math import ceil, trunc as math_trunc
 from typing import Union
 
@@ -346,19 +347,34 @@ def to_exchange_symbol(blankly_symbol, exchange):
         return blankly_symbol.replace("-", "/")
 
 
-def get_base_asset(symbol):
-    # Gets the BTC of the BTC-USD
-    return symbol.split('-')[0]
+@lru_cache(maxsize=256)
+def split_symbol(symbol) -> tuple:
+    """
+    Split a symbol such as 'BTC-USD' into its base & quote assets. The same handful of symbols are parsed repeatedly
+     (every fill in a backtest), so the result is cached per symbol.
 
+    Args:
+        symbol: Symbol to split, such as 'BTC-USD'
 
-def get_quote_asset(symbol):
-    # Gets the USD of the BTC-USD
+    Returns:
+        tuple: (base, quote) such as ('BTC', 'USD')
+    """
     split = symbol.split('-')
     if len(split) > 1:
-        return split[1]
+        return split[0], split[1]
     else:
         # This could go wrong
-        return 'USD'
+        return split[0], 'USD'
+
+
+def get_base_asset(symbol):
+    # Gets the BTC of the BTC-USD
+    return split_symbol(symbol)[0]
+
+
+def get_quote_asset(symbol):
+    # Gets the USD of the BTC-USD
+    return split_symbol(symbol)[1]
 
 
 def rename_to(keys_array, renaming_dictionary):
@@ -0,0 +1,118 @@
+"""
+    Mail queue tests
+    Copyright (C) 2021  Emerson Dove
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Lesser General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+import blankly  # noqa: F401 - initializes the package before importing the reporter
+from blankly.deployment._mail_queue import MailQueue
+from blankly.deployment.reporter_headers import Reporter
+
+notify_preferences = {
+    'email': {
+        'port': 465,
+        'smtp_server': 'smtp.example.com',
+        'sender_email': 'sender@example.com',
+        'receiver_email': 'receiver@example.com',
+        'password': 'password'
+    },
+    'text': {
+        'provider': 'verizon',
+        'phone_number': '5551234567'
+    }
+}
+
+
+class MailQueueTest(unittest.TestCase):
+    def test_messages_are_batched(self):
+        batches = []
+        release = threading.Event()
+
+        def send_batch(batch):
+            # Hold the first batch so that the rest accumulate behind it
+            release.wait(5)
+            batches.append(list(batch))
+
+        mail_queue = MailQueue(send_batch)
+        mail_queue.put(('first', None))
+        for i in range(10):
+            mail_queue.put((str(i), 'receiver'))
+        release.set()
+
+        self.assertTrue(mail_queue.flush(5))
+        self.assertEqual(sum(batches, []), [('first', None)] + [(str(i), 'receiver') for i in range(10)])
+        self.assertLessEqual(len(batches), 2)
+
+    def test_flush_timeout(self):
+        release = threading.Event()
+        mail_queue = MailQueue(lambda batch: release.wait(5))
+        mail_queue.put(('message', None))
+
+        self.assertFalse(mail_queue.flush(.05))
+        release.set()
+        self.assertTrue(mail_queue.flush(5))
+
+    def test_flush_without_messages(self):
+        self.assertTrue(MailQueue(lambda batch: None).flush(1))
+
+    def test_send_error_is_raised_from_flush(self):
+        sent = []
+
+        def send_batch(batch):
+            if batch[0][0] == 'bad':
+                raise RuntimeError("SMTP authentication failed")
+            sent.extend(batch)
+
+        mail_queue = MailQueue(send_batch)
+        mail_queue.put(('bad', None))
+        with self.assertRaises(RuntimeError):
+            mail_queue.flush(5)
+
+        # The error is only reported once & the worker keeps sending later messages
+        mail_queue.put(('good', None))
+        self.assertTrue(mail_queue.flush(5))
+        self.assertEqual(sent, [('good', None)])
+
+
+class ReporterQueueTest(unittest.TestCase):
+    def test_queued_email_and_text_share_a_session(self):
+        main_thread = threading.current_thread()
+        queued = threading.Event()
+
+        def load_preferences():
+            # Hold the worker until both messages are queued so they are sent as one batch
+            if threading.current_thread() is not main_thread:
+                queued.wait(5)
+            return notify_preferences
+
+        with mock.patch('blankly.deployment.reporter_headers.load_notify_preferences', load_preferences), \
+                mock.patch('blankly.deployment.reporter_headers.smtplib.SMTP_SSL') as smtp_ssl:
+            reporter = Reporter()
+            reporter.enqueue_email('email body')
+            reporter.enqueue_text('text body')
+            queued.set()
+            self.assertTrue(reporter.flush(5))
+
+        smtp_ssl.assert_called_once()
+        server = smtp_ssl.return_value.__enter__.return_value
+        server.login.assert_called_once_with('sender@example.com', 'password')
+        self.assertEqual(server.sendmail.call_args_list, [
+            mock.call('sender@example.com', 'receiver@example.com', 'email body'),
+            mock.call('sender@example.com', '5551234567@vtext.com', 'text body')
+        ])
@@ -0,0 +1,50 @@
+"""
+    Local account tests
+    Copyright (C) 2021  Emerson Dove
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Lesser General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+import blankly  # noqa: F401 - initializes the package before importing the local account
+from blankly.exchanges.interfaces.paper_trade.local_account.trade_local import LocalAccount
+from blankly.utils.utils import AttributeDict
+
+
+class LocalAccountTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.account = LocalAccount({
+            'BTC': AttributeDict({'available': 1.0, 'hold': 0.0}),
+            'USD': AttributeDict({'available': 1000.0, 'hold': 0.0})
+        })
+
+    def test_trade_local_truncates_to_resolution(self):
+        self.account.trade_local('BTC-USD', 'buy', base_delta=0.123456789, quote_delta=-100.129,
+                                 quote_resolution=2, base_resolution=8)
+
+        self.assertEqual(self.account.get_account('BTC')['available'], 1.12345678)
+        self.assertEqual(self.account.get_account('USD')['available'], 899.87)
+
+    def test_missing_base_leaves_account_unchanged(self):
+        before = self.account.get_accounts()
+        with self.assertRaises(KeyError):
+            self.account.trade_local('ETH-USD', 'buy', 1, -100, 2, 8)
+        self.assertEqual(self.account.get_accounts(), before)
+
+    def test_missing_quote_leaves_account_unchanged(self):
+        before = self.account.get_accounts()
+        with self.assertRaises(KeyError):
+            self.account.trade_local('BTC-EUR', 'buy', 1, -100, 2, 8)
+        self.assertEqual(self.account.get_accounts(), before)
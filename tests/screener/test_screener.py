@@ -0,0 +1,115 @@
+"""
+    Screener tests
+    Copyright (C) 2021  Emerson Dove
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Lesser General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+from collections import Counter, defaultdict
+import time
+import unittest
+
+import blankly
+from blankly.frameworks.screener.screener import Screener, _clone
+from blankly.utils.utils import AttributeDict
+
+
+class CloneTest(unittest.TestCase):
+    def test_nested_containers_are_copied(self):
+        raw = {'BTC-USD': {'value': 1, 'notes': [1, 2, {'rsi': .45}]}}
+        cloned = _clone(raw)
+        self.assertEqual(raw, cloned)
+
+        cloned['BTC-USD']['value'] = 2
+        cloned['BTC-USD']['notes'][2]['rsi'] = 0
+        self.assertEqual(raw['BTC-USD']['value'], 1)
+        self.assertEqual(raw['BTC-USD']['notes'][2]['rsi'], .45)
+
+    def test_attribute_dict_is_preserved(self):
+        cloned = _clone({'BTC-USD': AttributeDict({'value': 1})})
+        self.assertIsInstance(cloned['BTC-USD'], AttributeDict)
+        self.assertEqual(cloned['BTC-USD'].value, 1)
+
+    def test_defaultdict_is_preserved(self):
+        raw = {'a': defaultdict(list, {'x': [1]})}
+        cloned = _clone(raw)
+        self.assertIsInstance(cloned['a'], defaultdict)
+        self.assertIs(cloned['a'].default_factory, list)
+        self.assertEqual(cloned['a']['x'], [1])
+
+        cloned['a']['x'].append(2)
+        self.assertEqual(raw['a']['x'], [1])
+
+    def test_counter_is_preserved(self):
+        cloned = _clone({'a': Counter(a=1)})
+        self.assertIsInstance(cloned['a'], Counter)
+        self.assertEqual(cloned['a'], Counter(a=1))
+
+
+class FakeExchange:
+    interface = None
+
+
+class ScreenerTest(unittest.TestCase):
+    symbols = ['BTC-USD', 'ETH-USD', 'SOL-USD', 'LINK-USD', 'ADA-USD']
+
+    def setUp(self) -> None:
+        # Avoid scheduling a screener runner from the deployment settings
+        self.previous_runner = blankly._screener_runner
+        blankly._screener_runner = object()
+
+    def tearDown(self) -> None:
+        blankly._screener_runner = self.previous_runner
+
+    def test_results_keep_symbol_order(self):
+        def evaluator(symbol, screener_state):
+            # Finish the earlier symbols last
+            time.sleep(.01 * (len(self.symbols) - self.symbols.index(symbol)))
+            return symbol
+
+        screener = Screener(FakeExchange(), evaluator, list(self.symbols))
+        self.assertEqual(list(screener.raw_results.keys()), self.symbols)
+        for symbol in self.symbols:
+            self.assertEqual(screener.raw_results[symbol], {'value': symbol})
+
+    def test_evaluator_exception_propagates(self):
+        def evaluator(symbol, screener_state):
+            if symbol == 'SOL-USD':
+                raise RuntimeError("evaluator failed")
+            return 1
+
+        with self.assertRaises(RuntimeError):
+            Screener(FakeExchange(), evaluator, list(self.symbols))
+
+    def test_single_worker_is_serial(self):
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def evaluator(symbol, screener_state):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(.01)
+            with lock:
+                active[0] -= 1
+            return 1
+
+        Screener(FakeExchange(), evaluator, list(self.symbols), max_workers=1)
+        self.assertEqual(peak[0], 1)
+
+    def test_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            Screener(FakeExchange(), lambda symbol, screener_state: 1, list(self.symbols), max_workers=0)
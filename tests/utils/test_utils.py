@@ -0,0 +1,41 @@
+"""
+    Utils tests
+    Copyright (C) 2021  Emerson Dove
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Lesser General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+import blankly  # noqa: F401 - initializes the package before importing utils
+from blankly.utils.utils import get_base_asset, get_quote_asset, split_symbol
+
+
+class SymbolTest(unittest.TestCase):
+    def test_split_symbol(self):
+        self.assertEqual(split_symbol('BTC-USD'), ('BTC', 'USD'))
+        self.assertEqual(split_symbol('ETH-BTC'), ('ETH', 'BTC'))
+
+    def test_split_symbol_defaults_quote(self):
+        self.assertEqual(split_symbol('BTC'), ('BTC', 'USD'))
+
+    def test_split_symbol_is_cached(self):
+        # Repeated calls return the same cached tuple
+        self.assertIs(split_symbol('SOL-USDT'), split_symbol('SOL-USDT'))
+
+    def test_base_and_quote_asset(self):
+        self.assertEqual(get_base_asset('BTC-USD'), 'BTC')
+        self.assertEqual(get_quote_asset('BTC-USD'), 'USD')
+        self.assertEqual(get_base_asset('AAPL'), 'AAPL')
+        self.assertEqual(get_quote_asset('AAPL'), 'USD')